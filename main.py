@@ -6,9 +6,11 @@
 # jan-2026
 
 import argparse
+import csv
 import os
 import sys
-import json
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import pandas as pd
 
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -17,9 +19,11 @@ from src.config import ALL_ROOTS
 from src.domain.generators.asturian import AsturianGenerator
 from src.domain.generators.basque import BasqueGenerator
 from src.domain.generators.greek import GreekGenerator
+from src.domain.generators.seeds import SEED_COLUMNS
 from src.domain.scrapers.wiktionary import WiktionaryScraper
 from src.mining.miner import WikipediaMiner
 from src.mining.cleaner import MiningCleaner
+from src.mining.dedup import MiningDeduplicator
 from src.analysis.stats import BorrowingStats
 from src.analysis.plot import BorrowingPlots
 from src.analysis.sampler import get_unannotated_gold_sample as sample
@@ -34,14 +38,12 @@ PLOTS_DIR = "plots"
 
 SEEDS_FILE = os.path.join(RAW_DIR, "synthetic_borrowings.csv")
 MINED_FILE = os.path.join(MINED_DIR, "mined_sentences.jsonl")
+DEDUP_FILE = os.path.join(MINED_DIR, "mined_sentences.dedup.jsonl")
 CLEAN_FILE = os.path.join(PROCESSED_DIR, "mined_sentences.clean.jsonl")
 STATS_FILE = os.path.join(PLOTS_DIR, "stats")
 WIKTIONARY_FILE = os.path.join(RAW_DIR, "wiktionary_borrowings.csv")
 CORPUS_FILE = os.path.join(PROCESSED_DIR, "corpus_terms.csv")
 
-for d in [RAW_DIR, MINED_DIR, PROCESSED_DIR, PLOTS_DIR]:
-    os.makedirs(d, exist_ok=True)
-
 # -----------------------------------------------------------------------------------------
 
 def run_scraping():
@@ -77,15 +79,17 @@ def run_generation():
     else:
         print("\tNo Wiktionary seeds loaded (file missing or empty).")
         
-    df = pd.DataFrame(all_seeds)
-    df_clean = df.drop_duplicates(subset=['term', 'lang', 'type'])
-    
-    df_clean.to_csv(SEEDS_FILE, index=False)
+    # already unique on (term, lang, type): each source dedups its own seeds, and sources never share a (lang, type)
+    # seed tuples written straight by the stdlib (C) csv writer, no DataFrame in between
+    with open(SEEDS_FILE, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(SEED_COLUMNS)
+        writer.writerows(all_seeds)
     
-    print(f">>> Generated {len(df_clean)} unique seeds.")
+    print(f">>> Generated {len(all_seeds)} unique seeds.")
     print(f"\tSaved to: {SEEDS_FILE}")
     print("\tSample:")
-    print(df_clean.head(3).to_string(index=False))
+    print(pd.DataFrame.from_records(all_seeds[:3], columns=SEED_COLUMNS).to_string(index=False))
 
 
 def run_mining():
@@ -95,29 +99,72 @@ def run_mining():
         print(f"(!) > Seeds file not found at {SEEDS_FILE}. Run 'generate' first.")
         return
 
-    df_seeds = pd.read_csv(SEEDS_FILE)
+    # Arrow-backed string columns: faster parse, lower memory than object dtype
+    df_seeds = pd.read_csv(SEEDS_FILE, engine='pyarrow', dtype_backend='pyarrow')
     print(f"\tLoaded {len(df_seeds)} seeds.")
     
-    miner = WikipediaMiner(user_agent="LexicalBorrowingsTFM/1.0 (masters_thesis)")
+    miner = WikipediaMiner(user_agent="LexicalBorrowingsTFM/1.0 (https://github.com/adrmisty/tfm-low-res-lexical-borrowings; masters_thesis)")
+    
+    found = 0
+    written = 0
     
-    results = miner.search_and_extract(df_seeds, limit_per_seed=5)
+    # a deduplicated file from a previous mining run would no longer match the mined file
+    if os.path.exists(DEDUP_FILE):
+        os.remove(DEDUP_FILE)
     
-    with open(MINED_FILE, "w", encoding="utf-8") as f:
-        for entry in results:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    # written seed by seed as they are mined: the miner only holds the matches of the terms submitted ahead
+    # (a few per thread) or still used by a later seed, and an interrupted run stops mining (queued seeds are cancelled)
+    # with the file holding every seed done so far
+    with open(MINED_FILE, "wb") as f:
+        for entries in miner.iter_seed_results(df_seeds, limit_per_seed=5, concurrency=8):
+            found += len(entries)
+            lines = []
+            # exact repeats (same sentence from the same page) are dropped before writing, within each seed:
+            # seeds are unique on (term, lang, type), and the same sentence found for another seed is a separate annotation
+            seen = set()
+            for entry in entries:
+                key = (entry.get('source_page', ''), entry['sentence'])
+                if key not in seen:
+                    seen.add(key)
+                    lines.append(orjson.dumps(entry))
+            if lines:
+                # one joined write per seed, instead of one write per entry
+                f.write(b"\n".join(lines) + b"\n")
+                written += len(lines)
             
-    print(f">>> Mining complete. Found {len(results)} sentences.")
+    print(f">>> Mining complete. Found {written} sentences ({found - written} exact repeats dropped).")
     print(f"\tSaved to: {MINED_FILE}")
 
 
+def run_dedup():
+    print(f"\n[2b] Removing near-duplicate mined sentences...")
+    if not os.path.exists(MINED_FILE):
+        print("(!) > Mined file not found. Run 'mine' first.")
+        return
+
+    dedup = MiningDeduplicator(threshold=0.8)
+    # near-duplicates within each seed only (another seed's sentence is a separate annotation, as when mining);
+    # written to its own file: the raw mined file is kept, so dedup can be re-run without mining again
+    kept, dropped = dedup.dedup_file(MINED_FILE, DEDUP_FILE)
+    
+    print(f">>> Deduplication complete.")
+    print(f"\tKept: {kept}")
+    print(f"\tDropped (Near-duplicates): {dropped}")
+    print(f"\tSaved to: {DEDUP_FILE}")
+
+
 def run_cleaning():
     print(f"\n[3] Cleaning mined data...")
     if not os.path.exists(MINED_FILE):
         print("(!) > Mined file not found. Run 'mine' first.")
         return
 
+    # deduplicated sentences if the 'dedup' step was run after the last mining run ('mine' removes it), the raw mined ones otherwise
+    input_file = DEDUP_FILE if os.path.exists(DEDUP_FILE) else MINED_FILE
+    print(f"\tReading: {input_file}")
+
     cleaner = MiningCleaner()
-    kept, d_eng, d_sem = cleaner.clean_file(MINED_FILE, CLEAN_FILE)
+    kept, d_eng, d_sem = cleaner.clean_file(input_file, CLEAN_FILE)
             
     print(f">>> Cleaning complete.")
     print(f"\tKept: {kept}")
@@ -144,11 +191,8 @@ def run_analysis():
         print(f"(!) > Clean file not found at {CLEAN_FILE}. Run 'clean' first.")
         return
 
-    data = []
-    with open(CLEAN_FILE, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                data.append(json.loads(line))
+    with open(CLEAN_FILE, 'rb') as f:
+        data = [orjson.loads(line) for line in f if line.strip()]
     
     if not data:
         print("\t(!) > Clean file is empty. No data to plot.")
@@ -157,18 +201,22 @@ def run_analysis():
     df = pd.DataFrame(data)
     viz = BorrowingPlots(df)
     
-    print("\tGenerating word-class plot...")
-    viz.plot_pos_distribution(os.path.join(PLOTS_DIR, "1_pos_distribution.png"))
-    
-    print("\tGenerating morphological integration plot...")
-    viz.plot_integration_strategies(os.path.join(PLOTS_DIR, "2_integration_strats.png"))
-    
-    print("\tGenerating visual fidelity plot...")
-    viz.plot_spelling_adaptation(os.path.join(PLOTS_DIR, "3_spelling_retained.png"))
+    plots = [
+        ("word-class plot", viz.plot_pos_distribution, "1_pos_distribution.png"),
+        ("morphological integration plot", viz.plot_integration_strategies, "2_integration_strats.png"),
+        ("visual fidelity plot", viz.plot_spelling_adaptation, "3_spelling_retained.png"),
+        ("(synthetic vs. wiktionary) data comparison", viz.plot_data_amounts, "4_dataset_sizes.png"),
+        ("origin languages plot", viz.plot_origin_languages, "5_origin_langs.png"),
+    ]
     
-    print("\tGenerating (synthetic vs. wiktionary) data comparison...")
-    viz.plot_data_amounts(os.path.join(PLOTS_DIR, "4_dataset_sizes.png"))
-    viz.plot_origin_languages(os.path.join(PLOTS_DIR, "5_origin_langs.png"))
+    # plots are independent figures: render and save them in parallel
+    with ThreadPoolExecutor(max_workers=len(plots)) as executor:
+        futures = []
+        for name, plot, filename in plots:
+            print(f"\tGenerating {name}...")
+            futures.append(executor.submit(plot, os.path.join(PLOTS_DIR, filename)))
+        for future in futures:
+            future.result()
     
     print(f">>> Plots saved to directory: {PLOTS_DIR}/")
 
@@ -184,12 +232,16 @@ if __name__ == "__main__":
     
     parser.add_argument(
         "step", 
-        choices=["scrape", "generate", "mine", "clean", "analyze", "sample", "corpus", "all"],
+        choices=["scrape", "generate", "mine", "dedup", "clean", "analyze", "sample", "corpus", "all"],
         help="The pipeline step to execute."
     )
     
     args = parser.parse_args()
     
+    # created when running the pipeline only, not as a side effect of importing this module
+    for d in [RAW_DIR, MINED_DIR, PROCESSED_DIR, PLOTS_DIR]:
+        os.makedirs(d, exist_ok=True)
+    
     if args.step in ["scrape", "all"]:
         run_scraping()
 
@@ -199,6 +251,9 @@ if __name__ == "__main__":
     if args.step in ["mine", "all"]:
         run_mining()
         
+    if args.step in ["dedup", "all"]:
+        run_dedup()
+        
     if args.step in ["clean", "all"]:
         run_cleaning()
                 
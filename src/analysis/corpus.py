@@ -6,9 +6,16 @@
 # feb-2026
 
 import pandas as pd
-import json
+import orjson
+import csv
 import os
 
+# raw tab-separated lexicons: no header, no quoting, every field kept as a literal string ('null', 'NA'...)
+TSV_OPTIONS = dict(sep='\t', header=None, dtype=str, quoting=csv.QUOTE_NONE, na_filter=False, on_bad_lines='skip')
+
+RESULT_COLUMNS = ['lang', 'term', 'frequency', 'category', 'source_types',
+                  'is_valid_cognate', 'is_valid_integrated', 'is_valid_historical']
+
 class CorpusValidator:
     """Validates a corpus by checking external data sources for each language."""
     
@@ -41,8 +48,7 @@ class CorpusValidator:
         for (lang, term), stats in self.stats.items():
             term_lower = str(term).lower()
             
-            is_wiktionary = any('wiktionary' in t.lower() for t in stats['types'])
-            category = 'established' if is_wiktionary else 'new/tech'
+            category = 'established' if stats['is_wik'] else 'new/tech'
             
             AST_is_cognate = 0      # AST
             EU_is_integrated = 0   # EU
@@ -69,7 +75,13 @@ class CorpusValidator:
                 'is_valid_historical': EL_is_historical  
             })
             
-        df = pd.DataFrame(results)
+        # declared columns and compact dtypes: no per-column inference, cheaper filters in _print
+        df = pd.DataFrame.from_records(results, columns=RESULT_COLUMNS)
+        df['lang'] = df['lang'].astype('category')
+        df['category'] = df['category'].astype('category')
+        for col in ['is_valid_cognate', 'is_valid_integrated', 'is_valid_historical']:
+            df[col] = df[col].astype('int8')
+            
         os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
         df.to_csv(self.output_file, index=False)
         print(f">>> Full mined-sentence corpus validation saved to: {self.output_file}")
@@ -86,11 +98,11 @@ class CorpusValidator:
 
         print(f"> Scanning full corpus: {self.input_file} ...")
         
-        with open(self.input_file, 'r', encoding='utf-8') as f:
+        with open(self.input_file, 'rb') as f:
             for line in f:
                 if not line.strip(): continue
                 try:
-                    row = json.loads(line)
+                    row = orjson.loads(line)
                     lang = row.get('lang')
                     term = row.get('term')
                     t_type = row.get('type', 'unknown')
@@ -100,12 +112,15 @@ class CorpusValidator:
                     key = (lang, term)
                     
                     if key not in self.stats:
-                        self.stats[key] = {'freq': 0, 'types': set()}
+                        self.stats[key] = {'freq': 0, 'types': set(), 'is_wik': False}
                     
                     self.stats[key]['freq'] += 1
                     self.stats[key]['types'].add(t_type)
+                    # flagged while scanning, so process() does not rescan the types
+                    if 'wiktionary' in t_type.lower():
+                        self.stats[key]['is_wik'] = True
                     
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     continue
         print(f"> Found {len(self.stats)} unique term entries.")
         
@@ -142,14 +157,11 @@ class CorpusValidator:
 
         # ** COGNET ** (Asturian -> Latin/Spanish Cognates)
         try:
-            with open(self.path_cognet, 'r', encoding='utf-8') as f:
-                for line in f:
-                    parts = line.strip().split('\t')
-                    if len(parts) >= 5:
-                        l1, t1, l2 = parts[1], parts[2], parts[3]
-                        # We capture Asturian terms that share a root with Spanish, Latin, or Iberian
-                        if l1 == 'ast' and l2 in ['spa', 'lat', 'xib']:
-                            self.sources['ast_cognates'].add(t1.lower())
+            df = pd.read_csv(self.path_cognet, usecols=[1, 2, 3], **TSV_OPTIONS)
+            l1, t1, l2 = df[1], df[2], df[3]
+            # We capture Asturian terms that share a root with Spanish, Latin, or Iberian
+            mask = (l1 == 'ast') & l2.isin(['spa', 'lat', 'xib'])
+            self.sources['ast_cognates'].update(t1[mask].str.lower())
                             
             print(f" > Asturian: loaded {len(self.sources['ast_cognates'])} cognates from CogNet.")
         except FileNotFoundError:
@@ -157,24 +169,17 @@ class CorpusValidator:
 
         # ** BASQUE ** (morphology validation)
         try:
-            with open(self.path_unimorph, 'r', encoding='utf-8') as f:
-                for line in f:
-                    parts = line.strip().split('\t')
-                    if len(parts) >= 2:
-                        form = parts[1] # inflection
-                        self.sources['eu_forms'].add(form.lower())
+            df = pd.read_csv(self.path_unimorph, usecols=[1], **TSV_OPTIONS)
+            forms = df[1] # inflection
+            self.sources['eu_forms'].update(forms[forms != ''].str.lower())
             print(f"> Basque: loaded {len(self.sources['eu_forms'])} inflected forms from Unimorph.")
         except FileNotFoundError:
             print(f"(!) > Warning: Unimorph file not found at {self.path_unimorph}")
 
         # ** GREEK ** established loans
         try:
-            with open(self.path_conloan, 'r', encoding='utf-8') as f:
-                for line in f:
-                    parts = line.strip().split('\t')
-                    if len(parts) >= 1:
-                        term = parts[0]
-                        self.sources['el_loans'].add(term.lower())
+            df = pd.read_csv(self.path_conloan, usecols=[0], **TSV_OPTIONS)
+            self.sources['el_loans'].update(df[0].str.lower())
             print(f"> Greek: loaded {len(self.sources['el_loans'])} historical loans from ConLoan.")
         except FileNotFoundError:
             print(f"(!) > Warning: ConLoan file not found at {self.path_conloan}")
\ No newline at end of file
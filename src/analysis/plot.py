@@ -5,139 +5,139 @@
 # adriana r.f. (@adrmisty)
 # jan-2026
 
+import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 matplotlib.use('Agg')
 
+# UNINTEGRATED (raw and codeswitches)
+UNINTEGRATED = ["noun_raw", "noun_plural_english", "cs_latin_raw"]
+# LIGHT VERBS with native grammar
+LIGHT_VERBS = ["verb_light_construction", "verb_light_latin", "verb_light_greek"]
+# INTEGRATED with morphological adaptation
+INTEGRATED = ["noun_plural_native", "noun_integrated_sg", "noun_integrated_pl", 
+              "noun_transliterated", "verb_morph_prescriptive", "verb_morph_descriptive",
+              "verb_participle_prescriptive", "verb_participle_descriptive",
+              "verb_morph_integrated", "verb_habitual", "verb_morph_aro", "verb_participle"]
+
 class BorrowingPlots:
     """Plots for lexical borrowing statistics, depending on source, language, degree of integration..."""
+    
+    # type -> integration level (anything else is 'Other')
+    _INTEG_MAP = {
+        **{t: "1. Unintegrated" for t in UNINTEGRATED},
+        **{t: "2. Accommodated (light verb)" for t in LIGHT_VERBS},
+        **{t: "3. Highly integrated" for t in INTEGRATED}
+    }
+    
+    # type -> spelling strategy (anything else is 'Modified (nativization)')
+    # RETAINED: English spelling is preserved 100% (foreignization)
+    _SPELLING_MAP = {t: "Retained (foreignization)" for t in UNINTEGRATED + LIGHT_VERBS}
+    
     def __init__(self, df: pd.DataFrame):
         self.df = df.copy()
         sns.set_theme(style="whitegrid")
         
-        self.df['data_source'] = self.df['type'].apply(
-            lambda t: "Established (Wiktionary)" if "wiktionary" in str(t) else "Tech neologism (Synthetic)"
+        # few distinct values repeated over all sentences: categorical codes instead of one string object per row
+        # (type-based maps and string matches are then computed once per category; a map result can stay categorical,
+        # so it is made object before filling unmapped types with a label outside its categories)
+        for col in ("lemma", "type"):
+            if col in self.df:
+                self.df[col] = self.df[col].astype("category")
+        
+        # categorical, so the per-plot source filters compare int codes instead of strings
+        is_wiktionary = self.df['type'].str.contains("wiktionary", regex=False, na=False)
+        self.df['data_source'] = pd.Categorical(
+            np.where(is_wiktionary, "Established (Wiktionary)", "Tech neologism (Synthetic)"),
+            categories=["Tech neologism (Synthetic)", "Established (Wiktionary)"]
         )
+        
+        # per-source subsets, filtered once and shared (read-only) by all plots
+        self._synth = self.df[self.df['data_source'] == "Tech neologism (Synthetic)"]
+        self._wik = self.df[self.df['data_source'] == "Established (Wiktionary)"]
+
+    # object-oriented API only (no pyplot global state), so that plots can be rendered in parallel threads
+    def _figure(self, figsize=(8, 6)):
+        fig = Figure(figsize=figsize)
+        return fig, fig.subplots()
+
+    def _save(self, fig, ax, output_path):
+        ax.set_ylabel("Sentences found")
+        fig.tight_layout()
+        fig.savefig(output_path)
 
     def plot_pos_distribution(self, output_path):
         """Visualizes Noun vs Verb dominance (Tech Neologisms only)."""
-        
-        df_synth = self.df[self.df['data_source'] == "Tech neologism (Synthetic)"].copy()
+        df_synth = self._synth
         
         if df_synth.empty:
             print("(!) Warning: No synthetic data for PoS plot.")
             return
 
-        plt.figure(figsize=(8, 6))
-        sns.countplot(data=df_synth, x="lang", hue="pos", palette="viridis")
-        plt.title("Part-of-Speech distribution [tech neologisms]")
-        plt.ylabel("Sentences found")
-        plt.tight_layout()
-        plt.savefig(output_path)
-        plt.close()
+        fig, ax = self._figure()
+        sns.countplot(data=df_synth, x="lang", hue="pos", palette="viridis", ax=ax)
+        ax.set_title("Part-of-Speech distribution [tech neologisms]")
+        self._save(fig, ax, output_path)
 
     def plot_integration_strategies(self, output_path):
         """Visualizes Wichmann's Integration Scale."""
-        df_synth = self.df[self.df['data_source'] == "Tech neologism (Synthetic)"].copy()
-        
-        df_synth['level'] = df_synth['type'].apply(self._map_integration)
+        df_synth = self._synth.assign(level=self._synth['type'].map(self._INTEG_MAP).astype(object).fillna("Other"))
         
-        plt.figure(figsize=(10, 6))
-        ax = sns.countplot(
+        fig, ax = self._figure(figsize=(10, 6))
+        sns.countplot(
             data=df_synth, 
             x="lang", 
             hue="level", 
             palette="rocket",
-            hue_order=["1. Unintegrated", "2. Accommodated (light verb)", "3. Highly integrated"]
+            hue_order=["1. Unintegrated", "2. Accommodated (light verb)", "3. Highly integrated"],
+            ax=ax
         )
         ax.set_yscale("log")
         
-        plt.title("Integration strategies [tech neologisms]")
-        plt.ylabel("Sentences found")
-        plt.tight_layout()
-        plt.savefig(output_path)
-        plt.close()
+        ax.set_title("Integration strategies [tech neologisms]")
+        self._save(fig, ax, output_path)
 
     def plot_spelling_adaptation(self, output_path):
         """Plots foreignization vs. nativization of spelling."""
         
-        df_synth = self.df[self.df['data_source'] == "Tech neologism (Synthetic)"].copy()
-        
-        df_synth['spelling'] = df_synth['type'].apply(self._map_spelling)
+        # MODIFIED: English spelling is adapted (nativization)
+        # e.g. native plurals ("clickes") and transliterations ("κλικ")
+        spelling = self._synth['type'].map(self._SPELLING_MAP).astype(object).fillna("Modified (nativization)")
+        df_synth = self._synth.assign(spelling=spelling)
         
-        plt.figure(figsize=(8, 6))
+        fig, ax = self._figure()
         sns.countplot(
             data=df_synth, 
             x="lang", 
             hue="spelling", 
             palette="Set2",
-            hue_order=["Retained (foreignization)", "Modified (nativization)"]
+            hue_order=["Retained (foreignization)", "Modified (nativization)"],
+            ax=ax
         )
-        plt.title("Spelling adaptation strategies [tech neologisms]")
-        plt.ylabel("Sentences found")
-        plt.tight_layout()
-        plt.savefig(output_path)
-        plt.close()
+        ax.set_title("Spelling adaptation strategies [tech neologisms]")
+        self._save(fig, ax, output_path)
 
     def plot_data_amounts(self, output_path):
         """Compares synthetic vs Wiktionary data volume."""
         
-        plt.figure(figsize=(8, 6))
-        sns.countplot(data=self.df, x="lang", hue="data_source", palette="mako")
-        plt.title("Dataset size comparison")
-        plt.ylabel("Sentences found")
-        plt.tight_layout()
-        plt.savefig(output_path)
-        plt.close()
+        fig, ax = self._figure()
+        sns.countplot(data=self.df, x="lang", hue="data_source", palette="mako", ax=ax)
+        ax.set_title("Dataset size comparison")
+        self._save(fig, ax, output_path)
 
     def plot_origin_languages(self, output_path):
         """Analyzes origin of established loans."""
         
-        df_wik = self.df[self.df['data_source'] == "Established (Wiktionary)"].copy()
-        if df_wik.empty: return
-
-        df_wik['origin'] = df_wik['type'].apply(lambda t: t.split('_')[-1] if '_' in t else "unknown")
-        
-        plt.figure(figsize=(8, 6))
-        sns.countplot(data=df_wik, x="lang", hue="origin", palette="magma")
-        plt.title("Origin of established loans")
-        plt.ylabel("Sentences found")
-        plt.tight_layout()
-        plt.savefig(output_path)
-        plt.close()
-        
-    # -----------------------------------------------------------------------------------------
+        if self._wik.empty: return
 
-    def _map_integration(self, t):
-        t = str(t)
+        # wiktionary_<origin> -> <origin>
+        types = self._wik['type']
+        origin = types.str.rsplit('_', n=1).str[-1]
+        df_wik = self._wik.assign(origin=origin.where(types.str.contains('_', regex=False, na=False), "unknown"))
         
-        # UNINTEGRATED (raw and codeswitches)
-        if t in ["noun_raw", "noun_plural_english", "cs_latin_raw"]:
-            return "1. Unintegrated"
-            
-        # LIGHT VERBS with native grammar
-        if t in ["verb_light_construction", "verb_light_latin", "verb_light_greek"]:
-            return "2. Accommodated (light verb)"
-            
-        # INTEGRATED with morphological adaptation
-        if t in ["noun_plural_native", "noun_integrated_sg", "noun_integrated_pl", 
-                 "noun_transliterated", "verb_morph_prescriptive", "verb_morph_descriptive",
-                 "verb_participle_prescriptive", "verb_participle_descriptive",
-                 "verb_morph_integrated", "verb_habitual", "verb_morph_aro", "verb_participle"]:
-            return "3. Highly integrated"
-            
-        return "Other"
-
-    def _map_spelling(self, t):
-        t = str(t)
-        
-        # RETAINED: English spelling is preserved 100% (foreignization)
-        if t in ["noun_raw", "noun_plural_english", "cs_latin_raw", 
-                 "verb_light_construction", "verb_light_latin", "verb_light_greek"]:
-            return "Retained (foreignization)"
-            
-        # MODIFIED: English spelling is adapted (nativization)
-        # e.g. native plurals ("clickes") and transliterations ("κλικ")
-        return "Modified (nativization)"
+        fig, ax = self._figure()
+        sns.countplot(data=df_wik, x="lang", hue="origin", palette="magma", ax=ax)
+        ax.set_title("Origin of established loans")
+        self._save(fig, ax, output_path)
@@ -5,8 +5,9 @@
 # ----------------------------------------------------------------
 # adriana r.f. (@adrmisty)
 # feb-2026
+import numpy as np
 import pandas as pd
-import json
+import orjson
 import os
 
 INPUT_FILE = "data/processed/mined_sentences.clean.jsonl"
@@ -14,11 +15,19 @@ OUTPUT_DIR = "data/annotation"
 #OUTPUT_FILE = os.path.join(OUTPUT_DIR, "gold_standard_sample.csv")
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "gold_standard_split.csv")
 SAMPLE_SIZE = 100
+LANGS = ['ast', 'eu', 'el']
 
 # columns
 # new category: old/new
 cols = ['lang', 'term', 'sentence', 'IS_VALID_LOAN', 'OTHER_LOANS', 'NOTES', 'category', 'type', 'source_page']
 
+def _shuffle_unique_terms(pool, seed=42):
+    """Shuffles the pool and keeps the first row per term, like pool.sample(frac=1, random_state=seed).drop_duplicates(subset=['term']).
+    Only positions are permuted (same RandomState stream as DataFrame.sample), so just the kept rows get copied."""
+    perm = np.random.RandomState(seed).permutation(len(pool))
+    is_dup = pd.Index(pool['term'].to_numpy()[perm]).duplicated(keep='first')
+    return pool.iloc[perm[~is_dup]]
+
 def get_unannotated_gold_sample(n=SAMPLE_SIZE, split=0.5):
     """Generates gold sample to-be-annotated of n random sentences."""
     if not os.path.exists(INPUT_FILE):
@@ -26,46 +35,53 @@ def get_unannotated_gold_sample(n=SAMPLE_SIZE, split=0.5):
         return
 
     print(f"> Loading data from {INPUT_FILE}...")
+    # one bulk read, split into lines in C (no per-line readline)
+    with open(INPUT_FILE, 'rb') as f:
+        lines = f.read().split(b"\n")
+        
     data = []
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                try:
-                    data.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue    
+    for line in lines:
+        if not line.strip(): continue
+        try:
+            data.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue
                 
     df = pd.DataFrame(data)
     final_samples = []
-    target_per_group = n * split  # fifty fifty
+    target_per_group = int(n * split)  # fifty fifty
     
-    for lang in ['ast', 'eu', 'el']:
-        print(f"\nProcessing [{lang}]...")
-        subset = df[df['lang'] == lang].copy()
-            
-        if subset.empty:
+    # source flag, one literal (non-regex) scan over the whole frame rather than one per language
+    df['is_wikt'] = df['type'].str.contains('wiktionary', case=False, na=False, regex=False)
+    
+    # one split by language, instead of a full-frame mask per language:
+    # groups come in LANGS order, and only for languages with data (other languages are left out)
+    by_lang = df.groupby(pd.Categorical(df['lang'], categories=LANGS), observed=True)
+    
+    for lang in LANGS:
+        if lang not in by_lang.groups:
             print(f"(!) > Warning: No lexical borrowing data found for {lang}")
-            continue
+    
+    for lang, subset in by_lang:
+        print(f"\nProcessing [{lang}]...")
                 
         # ** WIKTIONARY ** established borrowings
-        mask_wikt = subset['type'].str.contains('wiktionary', case=False, na=False)
-        pool_wikt = subset[mask_wikt].copy()
+        mask_wikt = subset['is_wikt'].to_numpy()
+        pool_wikt = subset.iloc[mask_wikt]
         # ** RAW/NEW ** synthetic borrowings
-        pool_syn = subset[~mask_wikt].copy()
+        pool_syn = subset.iloc[~mask_wikt]
         
-        wiktionary = pool_wikt.sample(frac=1, random_state=42).drop_duplicates(subset=['term'])
-        synthetic = pool_syn.sample(frac=1, random_state=42).drop_duplicates(subset=['term'])
+        wiktionary = _shuffle_unique_terms(pool_wikt, seed=42)
+        synthetic = _shuffle_unique_terms(pool_syn, seed=42)
         
-        # sample with the same seed        
-        n_wikt = int(min(target_per_group, len(wiktionary)))
-        sample_wikt = wiktionary.sample(n=n_wikt, random_state=42).copy()
-        sample_wikt['category'] = 'established'
-        n_syn = int(min(target_per_group, len(synthetic)))
-        sample_syn = synthetic.sample(n=n_syn, random_state=42).copy()
-        sample_syn['category'] = 'new'
+        # sample with the same seed (pools are only read: the category column is added on a new frame by assign)
+        n_wikt = min(target_per_group, len(wiktionary))
+        sample_wikt = wiktionary.sample(n=n_wikt, random_state=42)
+        n_syn = min(target_per_group, len(synthetic))
+        sample_syn = synthetic.sample(n=n_syn, random_state=42)
         
-        final_samples.append(sample_wikt)
-        final_samples.append(sample_syn)
+        final_samples.append(sample_wikt.assign(category='established'))
+        final_samples.append(sample_syn.assign(category='new'))
         
         print(f"    > Wiktionary (Established LWs): Found {n_wikt} unique terms")
         print(f"    > Synthetic  (New LWs): Found {n_syn} unique terms")
@@ -5,14 +5,21 @@
 # adriana r.f. (@adrmisty)
 # jan-2026
 
+import numpy as np
 import pandas as pd
-import json
+import orjson
+import pyarrow as pa
 import os
 
+# the only mined/clean fields the stats look at
+JSONL_COLUMNS = ['lang', 'term']
+JSONL_DTYPE = pd.ArrowDtype(pa.string())
+
 class BorrowingStats:
     """Computation of statistics of lexical borrowing data, and their distributions per language."""
 
-    def __init__(self, seeds_path, mined_path, clean_path):
+    def __init__(self, seeds_path, mined_path, clean_path, chunksize=200_000):
+        self.chunksize = chunksize # rows parsed before being packed into a DataFrame
         self.paths = {
             "seeds": seeds_path,
             "mined": mined_path,
@@ -24,6 +31,7 @@ class BorrowingStats:
     def report(self, output_dir):
         """Statistics table, for each language, saved to file."""
         langs = ['ast', 'eu', 'el']
+        self._count_per_language()
         all_stats = {lang: self._get_language_stats(lang) for lang in langs}
         
         os.makedirs(output_dir, exist_ok=True)
@@ -72,28 +80,17 @@ class BorrowingStats:
         """Computes statistics for a specific language."""
     
         # seed
-        seeds = self.data['seeds'][self.data['seeds']['lang'] == lang]
-        total_seeds = len(seeds)
-        synth_seeds = len(seeds[seeds['source_cat'] == 'Synthetic'])
-        wiki_seeds = len(seeds[seeds['source_cat'] == 'Wiktionary'])
+        synth_seeds = int(self.counts['seeds'].get((lang, 'Synthetic'), 0))
+        wiki_seeds = int(self.counts['seeds'].get((lang, 'Wiktionary'), 0))
+        total_seeds = synth_seeds + wiki_seeds
 
         # raw mined
-        if not self.data['mined'].empty:
-            mined = self.data['mined'][self.data['mined']['lang'] == lang]
-        else:
-            mined = pd.DataFrame(columns=['term'])
-        raw_sentences = len(mined)
-        found_terms_raw = mined['term'].unique() if not mined.empty else []
-        seeds_found_count = len(found_terms_raw)
+        raw_sentences = int(self.counts['mined']['sentences'].get(lang, 0))
+        seeds_found_count = int(self.counts['mined']['terms'].get(lang, 0))
 
         # processed mined
-        if not self.data['clean'].empty:
-            clean = self.data['clean'][self.data['clean']['lang'] == lang]
-        else:
-            clean = pd.DataFrame(columns=['term'])
-        valid_sentences = len(clean)
-        found_terms_clean = clean['term'].unique() if not clean.empty else []
-        seeds_valid_count = len(found_terms_clean)
+        valid_sentences = int(self.counts['clean']['sentences'].get(lang, 0))
+        seeds_valid_count = int(self.counts['clean']['terms'].get(lang, 0))
 
 
         # ratios
@@ -117,17 +114,35 @@ class BorrowingStats:
             "Yield (sentence/seed)": yield_per_seed
         }
 
+    def _count_per_language(self):
+        """Per-language counts, each table grouped once (instead of one boolean mask per language and category)."""
+        self.counts = {
+            'seeds': self.data['seeds'].groupby(['lang', 'source_cat']).size()
+        }
+        
+        for name in ['mined', 'clean']:
+            df = self.data[name]
+            if df.empty:
+                self.counts[name] = {'sentences': pd.Series(dtype=int), 'terms': pd.Series(dtype=int)}
+                continue
+            
+            terms = df.groupby('lang')['term']
+            self.counts[name] = {
+                'sentences': terms.size(),
+                'terms': terms.nunique(dropna=False) # counted in the hash pass, no per-group arrays of distinct terms
+            }
+
     # -----------------------------------------------------------------------------------------
 
     def _load_data(self):        
         # seed data, classified according to source /synthetic or wiktionary/
         if os.path.exists(self.paths['seeds']):
-            self.data['seeds'] = pd.read_csv(self.paths['seeds'])
+            # Arrow-backed strings: compact buffers, string kernels in C
+            self.data['seeds'] = pd.read_csv(self.paths['seeds'], engine='pyarrow', dtype_backend='pyarrow')
             
-            # classify source based on 'type' column
-            self.data['seeds']['source_cat'] = self.data['seeds']['type'].apply(
-                lambda x: 'Wiktionary' if 'wiktionary' in str(x).lower() else 'Synthetic'
-            )
+            # classify source based on 'type' column (one vectorized string scan, no per-row lambda)
+            is_wiktionary = self.data['seeds']['type'].str.contains('wiktionary', case=False, regex=False, na=False)
+            self.data['seeds']['source_cat'] = np.where(is_wiktionary, 'Wiktionary', 'Synthetic')
         else:
             print(f"(!) > Seeds file missing: {self.paths['seeds']}")
             self.data['seeds'] = pd.DataFrame(columns=['term', 'lang', 'type', 'source_cat'])
@@ -139,16 +154,24 @@ class BorrowingStats:
         self.data['clean'] = self._load_jsonl(self.paths['clean'])
 
     def _load_jsonl(self, filepath):
-        # jsonl data        
+        # jsonl data, streamed: only the needed columns are kept, packed into a DataFrame every `chunksize` rows
         if not os.path.exists(filepath):
             return pd.DataFrame()
         
-        data = []
-        with open(filepath, 'r', encoding='utf-8') as f:
+        chunks = []
+        rows = []
+        with open(filepath, 'rb') as f:
             for line in f:
-                if line.strip():
-                    try:
-                        data.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-        return pd.DataFrame(data)
+                if not line.strip(): continue
+                try:
+                    row = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                    
+                rows.append((row.get('lang'), row.get('term')))
+                if len(rows) >= self.chunksize:
+                    chunks.append(pd.DataFrame(rows, columns=JSONL_COLUMNS, dtype=JSONL_DTYPE))
+                    rows = []
+                    
+        chunks.append(pd.DataFrame(rows, columns=JSONL_COLUMNS, dtype=JSONL_DTYPE))
+        return pd.concat(chunks, ignore_index=True)
@@ -59,8 +59,11 @@ GREEK_TRANSLITERATION = {
     "troll": "τρολ"
 }
 
-# TO AVOID MINING ENGLISH TEXTS
-ENGLISH_STOPWORDS = {
+# stressed -> unstressed vowels, so that the stems above can take a stressed suffix (-άρω)
+GREEK_DIACRITIC_STRIP = str.maketrans("άέίόύήώ", "αειουηω")
+
+# TO AVOID MINING ENGLISH TEXTS (read-only, lowercase)
+ENGLISH_STOPWORDS = frozenset({
     "the", "be", "to", "of", "and", "a", "in", "that", "have", "i", "it", "for", "not", "on", "with", "he", "as", "you", "do", "at",
     "this", "but", "his", "by", "from", "they", "we", "say", "her", "she", "or", "an", "will", "my", "one", "all", "would", "there",
     "their", "what", "so", "up", "out", "if", "about", "who", "get", "which", "go", "me", "when", "make", "can", "like", "time", "no",
@@ -70,4 +73,4 @@ ENGLISH_STOPWORDS = {
     "references", "external", "links", "bibliography", "source", "title", "date", "author", "publisher", "retrieved",
     "archived", "original", "page", "pages", "volume", "issue", "doi", "isbn", "issn", "pmid", "journal", "university", "press",
     "abstract", "introduction", "conclusion", "chapter"
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -5,7 +5,7 @@
 # adriana r.f. (@adrmisty)
 # jan-2026
 
-from typing import Dict, List
+from typing import List, Tuple
 from .seeds import BorrowingGenerator
 from src.config import N_ROOTS
 
@@ -13,7 +13,7 @@ class AsturianGenerator(BorrowingGenerator):
     def __init__(self):
         super().__init__("ast")
 
-    def generate_for_root(self, root: str) -> List[Dict]:
+    def generate_for_root(self, root: str) -> List[Tuple]:
         """Generates Asturian synthetic borrowing forms for a given root."""
         H = []
         
@@ -44,17 +44,13 @@ class AsturianGenerator(BorrowingGenerator):
         if root in N_ROOTS: return H
 
         # VERBS (prescriptive) -> PoS: VERB
-        def adapt_spelling(base, suffix):
-            if base.endswith("g") and suffix.startswith("i"): return base + "u" + suffix
-            if base.endswith("ck") and suffix.startswith("i"): return base[:-2] + "qu" + suffix
-            if base.endswith("k") and suffix.startswith("i"): return base[:-1] + "qu" + suffix
-            return base + suffix
-
         verb_stem = stem[:-1] if stem.endswith("e") and root in ["like", "update"] else stem
         
-        prescriptive = adapt_spelling(verb_stem, "iar")
+        # prescriptive spelling of the stem before -i- suffixes, adapted once for all of them
+        i_stem = self._adapt_before_i(verb_stem)
+        prescriptive = f"{i_stem}iar"
         H.append(self._make_seed(prescriptive, root, "verb_morph_prescriptive", "VERB"))
-        H.append(self._make_seed(adapt_spelling(verb_stem, "iáu"), root, "verb_participle_prescriptive", "VERB"))
+        H.append(self._make_seed(f"{i_stem}iáu", root, "verb_participle_prescriptive", "VERB"))
         
         # VERBS (Descriptive/Incorrect) -> PoS: VERB
         # click -> clickiar
@@ -63,4 +59,12 @@ class AsturianGenerator(BorrowingGenerator):
             H.append(self._make_seed(descriptive, root, "verb_morph_descriptive", "VERB"))
             H.append(self._make_seed(descriptive.replace("iar", "iáu"), root, "verb_participle_descriptive", "VERB"))
 
-        return H
\ No newline at end of file
+        return H
+
+    @staticmethod
+    def _adapt_before_i(base: str) -> str:
+        """Asturian spelling of a stem before an -i- suffix: blog -> blogu-, click -> cliqu-, hack -> haqu-."""
+        if base.endswith("g"): return base + "u"
+        if base.endswith("ck"): return base[:-2] + "qu"
+        if base.endswith("k"): return base[:-1] + "qu"
+        return base
\ No newline at end of file
@@ -5,20 +5,26 @@
 # adriana r.f. (@adrmisty)
 # jan-2026
 
-from typing import Dict, List
+import re
+from typing import List, Tuple
 from .seeds import BorrowingGenerator
 from src.config import N_ROOTS
 
+# phonetic adaptations, in a single pass: digraphs by regex, then single letters by translation table
+PHONETIC_DIGRAPHS = {"ch": "tx", "sh": "x", "ck": "k"}
+PHONETIC_DIGRAPH_RE = re.compile("|".join(PHONETIC_DIGRAPHS))
+PHONETIC_LETTERS = str.maketrans("cq", "kk")
+
 class BasqueGenerator(BorrowingGenerator):
     def __init__(self):
         super().__init__("eu")
 
-    def generate_for_root(self, root: str) -> List[Dict]:
+    def generate_for_root(self, root: str) -> List[Tuple]:
         """Generates Basque synthetic borrowing forms for a given root."""
         H = []
         
         # phonetic adaptations
-        phonetic_stem = root.lower().replace("ch", "tx").replace("sh", "x").replace("ck", "k").replace("c", "k").replace("q", "k")
+        phonetic_stem = PHONETIC_DIGRAPH_RE.sub(lambda m: PHONETIC_DIGRAPHS[m.group(0)], root.lower()).translate(PHONETIC_LETTERS)
         if "tweet" in phonetic_stem: phonetic_stem = phonetic_stem.replace("tweet", "tuit")
         if phonetic_stem.startswith("s") and len(phonetic_stem) > 1 and phonetic_stem[1] not in "aeiou": 
             phonetic_stem = "e" + phonetic_stem
@@ -5,16 +5,18 @@
 # adriana r.f. (@adrmisty)
 # jan-2026
 
-from typing import Dict, List
+from typing import List, Tuple
 from .seeds import BorrowingGenerator
-from src.config import GREEK_TRANSLITERATION
+from src.config import GREEK_TRANSLITERATION, GREEK_DIACRITIC_STRIP
 
 class GreekGenerator(BorrowingGenerator):
     def __init__(self):
         super().__init__("el")
         self.trans_map = GREEK_TRANSLITERATION
+        # unstressed stems (for the -άρω suffix), stripped once per stem instead of once per call
+        self.clean_map = {root: stem.translate(GREEK_DIACRITIC_STRIP) for root, stem in self.trans_map.items()}
 
-    def generate_for_root(self, root: str) -> List[Dict]:
+    def generate_for_root(self, root: str) -> List[Tuple]:
         """Generates Greek synthetic borrowing forms for a given root."""
         H = []
         
@@ -41,7 +43,7 @@ class GreekGenerator(BorrowingGenerator):
                     H.append(self._make_seed(f"{aux} {gk_stem}", root, "verb_light_greek", "VERB"))
                 
                 # VERBS: productive suffix (-άρω)
-                clean_stem = gk_stem.translate(str.maketrans("άέίόύήώ", "αειουηω"))
+                clean_stem = self.clean_map[root]
                 
                 H.append(self._make_seed(f"{clean_stem}άρω", root, "verb_morph_aro", "VERB"))
                 H.append(self._make_seed(f"{clean_stem}αρισμένος", root, "verb_participle", "VERB"))
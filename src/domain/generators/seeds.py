@@ -6,32 +6,41 @@
 # jan-2026
 
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from itertools import chain
+from typing import List, Tuple
 from src.config import N_ROOTS
 
+# seeds are plain tuples in this field order (smaller than dicts, DataFrame built with from_records)
+SEED_COLUMNS = ['term', 'lemma', 'lang', 'type', 'pos']
+
 class BorrowingGenerator(ABC):
     """Generates synthetic lexical borrowing forms (nouns, verbs)."""
     def __init__(self, lang_code: str):
         self.lang = lang_code
+        self._cache = {} # root -> generated seeds (forms are deterministic per root)
 
-    def generate_all(self, roots: List[str]) -> List[Dict]:
+    def generate_all(self, roots: List[str]) -> List[Tuple]:
+        """Seeds for all roots, without repeated (term, type) pairs (first occurrence kept)."""
+        seen = set() # lang is fixed per generator
         results = []
-        for root in roots:
-            results.extend(self.generate_for_root(root))
+        for seed in chain.from_iterable(map(self._generate_cached, roots)):
+            key = (seed[0], seed[3])
+            if key not in seen:
+                seen.add(key)
+                results.append(seed)
         return results
 
     @abstractmethod
-    def generate_for_root(self, root: str) -> List[Dict]:
+    def generate_for_root(self, root: str) -> List[Tuple]:
         pass
 
+    def _generate_cached(self, root: str) -> List[Tuple]:
+        if root not in self._cache:
+            self._cache[root] = self.generate_for_root(root)
+        return self._cache[root]
+
     def _make_seed(self, term, lemma, type_, pos):
-        return {
-            "term": term, 
-            "lemma": lemma, 
-            "lang": self.lang, 
-            "type": type_, 
-            "pos": pos
-        }
+        return (term, lemma, self.lang, type_, pos)
         
     def is_action_root(self, root):
         return root not in N_ROOTS
\ No newline at end of file
@@ -6,17 +6,28 @@
 # jan-2026
 
 import pandas as pd
+import csv
 import os
+import queue
+import threading
 import time
-from typing import List, Dict
+from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from src.domain.generators.seeds import SEED_COLUMNS
+
+QUEUED_PAGES = 64 # API pages of members (up to 500 titles each) buffered per category ahead of the writer
 
 class WiktionaryScraper:
     """Extractor for lexical borrowings in Wiktionary pages, for target languages from a given source languages.."""
     def __init__(self, csv_path):
         self.csv_path = csv_path
         self.base_url = "https://en.wiktionary.org/w/api.php"
-        self.headers = {"User-Agent": "LoanwordThesisBot/1.0 (academic_research)"}
+        self.headers = {"User-Agent": "LoanwordThesisBot/1.0 (https://github.com/adrmisty/tfm-low-res-lexical-borrowings; academic_research)"}
+        
+        # pooled keep-alive connections, shared by the category threads
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         
         # (target lang, source lang, wiktionary category)
         self.categories = [
@@ -35,30 +46,66 @@ class WiktionaryScraper:
     def scrape(self):
         """Scrapes and extracts lexical borrowings for the specified categories."""
         
-        all_data = []
+        # categories are fetched concurrently (network-bound); each API page of members is queued as it arrives
+        # and written in the categories' listed order, so the category in turn streams to disk while it is fetched;
+        # the queues are bounded, so a category waiting for its turn stops fetching QUEUED_PAGES pages ahead
+        queues = [queue.Queue(maxsize=QUEUED_PAGES) for _ in self.categories]
+        stop = threading.Event()
+        tmp_path = self.csv_path + ".part"
+        os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
         
-        for target, origin, category in self.categories:
-            print(f"\tFetching: {category} ({target} <- {origin})...")
-            terms = self._get_category_members(category)
-            print(f"\t\tFound {len(terms)} terms.")
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.categories)) as executor, \
+                    open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+                futures = []
+                for (target, origin, category), pages in zip(self.categories, queues):
+                    print(f"\tFetching: {category} ({target} <- {origin})...")
+                    futures.append(executor.submit(self._queue_category_members, category, pages, stop))
             
-            for term in terms:
-                all_data.append({
-                    "term": term,
-                    "target_lang": target,
-                    "origin_lang": origin,
-                    "source_category": category
-                })
-                
-        df = pd.DataFrame(all_data)
-        os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
-        df.to_csv(self.csv_path, index=False)
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(["term", "target_lang", "origin_lang", "source_category"])
+            
+                done = 0 # categories whose queue was read up to its end
+                try:
+                    for (target, origin, category), pages, future in zip(self.categories, queues, futures):
+                        found = 0
+                        for terms in iter(pages.get, None):
+                            writer.writerows((term, target, origin, category) for term in terms)
+                            found += len(terms)
+                        done += 1
+                        future.result() # re-raises if the category failed
+                        print(f"\t\t{category}: found {found} terms.")
+                except BaseException:
+                    # the other categories may be blocked on a full queue: stop them and empty their queues,
+                    # so the executor can shut down instead of waiting on them forever
+                    stop.set()
+                    for pages in queues[done:]:
+                        for _ in iter(pages.get, None):
+                            pass
+                    raise
+        except BaseException:
+            # no partial output left behind (the previous CSV is untouched)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        # only replaces the previous CSV once complete, so a failed scrape does not leave it half-written
+        os.replace(tmp_path, self.csv_path)
         
 
-    def _get_category_members(self, category_title):
-        """Get all members of a category."""
+    def _queue_category_members(self, category_title, pages: queue.Queue, stop: threading.Event):
+        """Puts each API page of members of a category in the queue, then None (also on failure or once stopped)."""
+        try:
+            for members in self._iter_category_members(category_title):
+                if stop.is_set():
+                    break
+                pages.put(members)
+        finally:
+            pages.put(None)
+
+    def _iter_category_members(self, category_title):
+        """Yields the members of a category, one API page (up to 500) at a time."""
         
-        members = []
         params = {
             "action": "query",
             "list": "categorymembers",
@@ -68,50 +115,38 @@ class WiktionaryScraper:
         }
         
         while True:
-            response = requests.get(self.base_url, params=params, headers=self.headers)
+            response = self.session.get(self.base_url, params=params)
             data = response.json()
             
             if "query" in data:
-                for member in data["query"]["categorymembers"]:
-                    if member['ns'] == 0:
-                        members.append(member['title'])
+                yield [member['title'] for member in data["query"]["categorymembers"] if member['ns'] == 0]
             
             if "continue" in data:
                 params["cmcontinue"] = data["continue"]["cmcontinue"]
                 time.sleep(0.1)
             else:
                 break
-                
-        return members
         
-    def load_seeds(self, target_langs: List[str] = None) -> List[Dict]:
+    def load_seeds(self, target_langs: List[str] = None) -> List[Tuple]:
         """Reads the Wiktionary CSV and converts it into standard Seed format."""
         
         if not os.path.exists(self.csv_path):
             print(f"(!) > Wiktionary file not found at {self.csv_path}")
             return []
 
-        # columns: term, target_lang, origin_lang, source_category
-        df = pd.read_csv(self.csv_path)
+        # columns: term, target_lang, origin_lang, source_category (Arrow-backed strings)
+        df = pd.read_csv(self.csv_path, engine='pyarrow', dtype_backend='pyarrow')
         
-        seeds = []
-        for _, row in df.iterrows():
-            t_lang = row['target_lang']
-            
-            if target_langs and t_lang not in target_langs:
-                continue
-
-            origin = row['origin_lang']
-            
-            seed_type = f"wiktionary_{origin}"
-            
-            seed = {
-                "term": row['term'],
-                "lemma": row['term'],
-                "lang": t_lang,
-                "type": seed_type,
-                "pos": "-"  # not specified by Wiktionary
-            }
-            seeds.append(seed)
+        if target_langs:
+            df = df[df['target_lang'].isin(target_langs)]
+        
+        # built column-wise, then converted to seed tuples in one go (no per-row Series boxing)
+        seeds = pd.DataFrame({
+            "term": df['term'],
+            "lemma": df['term'],
+            "lang": df['target_lang'],
+            "type": "wiktionary_" + df['origin_lang'].astype(str),
+            "pos": "-"  # not specified by Wiktionary
+        }).drop_duplicates(subset=['term', 'lang', 'type'])
             
-        return seeds
\ No newline at end of file
+        return list(seeds[SEED_COLUMNS].itertuples(index=False, name=None))
\ No newline at end of file
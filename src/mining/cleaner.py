@@ -6,23 +6,31 @@
 # jan-2026
 
 import re
-import json
+import os
+import orjson
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from src.config import ENGLISH_STOPWORDS
 
+# ascii words of a lowercased sentence (\b: not the ascii run of a word with accents, e.g. 'caf' in 'café')
+WORD_RE = re.compile(r'\b[a-z]+\b')
+
+# phrases that give away English text (reference lists, citations), most frequent first
+ENGLISH_PHRASES = ("references", "retrieved from", "tongue body")
+
 class EnglishFilter:
     def __init__(self, threshold=0.25):
         self.threshold = threshold
 
-    def is_english(self, sentence: str) -> bool:
+    def is_english(self, sentence: str, lowercased: bool = False) -> bool:
         """Determines if a sentence's major language is English."""
-        text = sentence.lower()
-        words = re.findall(r'\b[a-z]+\b', text)
+        text = sentence if lowercased else sentence.lower()
+        words = WORD_RE.findall(text)
         if not words: return False
 
-        if "references" in text: return True
-        if "retrieved from" in text: return True
+        if any(phrase in text for phrase in ENGLISH_PHRASES): return True
         if "how" in words and "an" in words and "our" in words: return True
-        if "tongue body" in text: return True 
 
         english_count = sum(1 for w in words if w in ENGLISH_STOPWORDS)
         density = english_count / len(words)
@@ -34,18 +42,26 @@ class EnglishFilter:
 
 class SemanticFilter:
     """Filters contexts that lead to false positives, and native homonyms that clash with lexical borrowings."""
+    
+    # context that makes an Asturian homonym a (digital) borrowing after all
+    _DIGITAL_KEYWORDS = ("internet", "blog", "web", "rede", "social", "facebook", "twitter", "instagram", "online")
+    
     def __init__(self):
         self.false_contexts = {
-            "post": ["rugbi", "tenis", "fútbol", "gol", "meta", "washington", "huffington", "diariu", "periódicu", "oficina"],
-            "chat": ["mont-du-chat", "chapelle", "lac", "savoie", "saboya", "comuña", "francia", "oise"],
-            "bot":  ["bot.", "zool.", "biol.", "sociedá", "nat.", "ser."],
-            "bug":  ["bunny", "looney", "river", "rio"],
-            "hack": ["hack-a-shaq"],
-            "ban":  ["ki-moon", "ki-mun", "banes", "bans", "jura", "cubanu", "croacia", "croatia", "hungary", "hungría", "12th", "xii"],
-            "log":  ["logarithm", "logaritmo", "les loges", "equation", "ecuación", "ph", "=", "+", "funtzio", "matemática"],
-            "troll": ["mitoloxía", "mythology", "gnome", "dwarf", "fantasy", "tolkien", "harry potter"],
-            "check": ["republic", "checa", "chess", "xedrez"],
-            "cloud": ["strife", "final fantasy", "saint-cloud"]
+            "post": ("rugbi", "tenis", "fútbol", "gol", "meta", "washington", "huffington", "diariu", "periódicu", "oficina"),
+            "chat": ("mont-du-chat", "chapelle", "lac", "savoie", "saboya", "comuña", "francia", "oise"),
+            "bot":  ("bot.", "zool.", "biol.", "sociedá", "nat.", "ser."),
+            "bug":  ("bunny", "looney", "river", "rio"),
+            "hack": ("hack-a-shaq",),
+            "ban":  ("ki-moon", "ki-mun", "banes", "bans", "jura", "cubanu", "croacia", "croatia", "hungary", "hungría", "12th", "xii"),
+            "log":  ("logarithm", "logaritmo", "les loges", "equation", "ecuación", "ph", "=", "+", "funtzio", "matemática"),
+            "troll": ("mitoloxía", "mythology", "gnome", "dwarf", "fantasy", "tolkien", "harry potter"),
+            "check": ("republic", "checa", "chess", "xedrez"),
+            "cloud": ("strife", "final fantasy", "saint-cloud")
+        }
+        # one alternation per lemma: a single scan of the sentence for any of its triggers
+        self.trigger_patterns = {
+            lemma: re.compile("|".join(map(re.escape, triggers))) for lemma, triggers in self.false_contexts.items()
         }
         
         self.homonym_terms = {
@@ -55,10 +71,11 @@ class SemanticFilter:
             "απ", # truncated 'από' preposition 'from' 
         }
 
-    def is_false_positive(self, entry: dict) -> bool:
+    def is_false_positive(self, entry: dict, sentence_lc: str = None) -> bool:
+        """`sentence_lc`: the entry's sentence already lowercased by the caller, if available."""
         term = entry.get('term', '').lower()
         lemma = entry.get('lemma', '').lower()
-        sentence = entry.get('sentence', '').lower()
+        sentence = sentence_lc if sentence_lc is not None else entry.get('sentence', '').lower()
         lang = entry.get('lang', '')
 
         if lang == 'eu' and lemma == 'ban':
@@ -68,53 +85,100 @@ class SemanticFilter:
             return True
 
         if lang == 'ast' and term in self.homonym_terms:
-            digital_keywords = ["internet", "blog", "web", "rede", "social", "facebook", "twitter", "instagram", "online"]
-            if not any(k in sentence for k in digital_keywords):
+            if not any(k in sentence for k in self._DIGITAL_KEYWORDS):
                 return True
 
-        if lemma in self.false_contexts:
-            triggers = self.false_contexts[lemma]
-            for trigger in triggers:
-                if trigger in sentence:
-                    return True
+        pattern = self.trigger_patterns.get(lemma)
+        if pattern is not None and pattern.search(sentence):
+            return True
                     
         return False
 
+# shared by all cleaners (and, per process, by the workers' cleaners): filters are built once on import
+_ENG_FILTER = EnglishFilter()
+_SEM_FILTER = SemanticFilter()
+
+CHUNK_LINES = 10_000 # lines per filtering task
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024 # smaller files are filtered serially: process start-up would dominate
+
+_worker_cleaner = None # one per worker process
+
+def _clean_chunk(lines):
+    """Worker entry point: filters a chunk of lines with the process' own cleaner."""
+    global _worker_cleaner
+    if _worker_cleaner is None:
+        _worker_cleaner = MiningCleaner()
+    return _worker_cleaner._filter_lines(lines)
+
 class MiningCleaner:
     """Applies pre-defined cleaning filters to mined data in a file."""
     
     def __init__(self):
-        self.eng_filter = EnglishFilter()
-        self.sem_filter = SemanticFilter()
+        self.eng_filter = _ENG_FILTER
+        self.sem_filter = _SEM_FILTER
     
-    def clean_file(self, input_path, output_path):
-        kept = []
+    def clean_file(self, input_path, output_path, workers=None):
+        """Filters the input file in chunks of lines, writing kept lines in input order as chunks are done (bounded memory).
+        Large files are filtered in parallel by `workers` processes (default: one per core)."""
+        workers = workers or os.cpu_count() or 1
+        kept = 0
         dropped_eng = 0
         dropped_sem = 0
         
-        with open(input_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if not line.strip(): continue
-                try:
-                    obj = json.loads(line)
-                    
-                    # avoid English sentences
-                    if self.eng_filter.is_english(obj['sentence']):
-                        dropped_eng += 1
-                        continue
-                    
-                    # potential false contexts + homonym clashes
-                    if self.sem_filter.is_false_positive(obj):
-                        dropped_sem += 1
-                        continue
-                        
-                    kept.append(obj)
-                    
-                except json.JSONDecodeError:
-                    continue
+        with open(input_path, 'rb') as f, open(output_path, 'wb') as out:
+            chunks = iter(lambda: list(islice(f, CHUNK_LINES)), [])
+            
+            if workers > 1 and os.path.getsize(input_path) >= PARALLEL_MIN_BYTES:
+                results = self._filter_parallel(chunks, workers)
+            else:
+                results = map(self._filter_lines, chunks)
+                
+            for kept_lines, n_eng, n_sem in results:
+                out.writelines(kept_lines)
+                kept += len(kept_lines)
+                dropped_eng += n_eng
+                dropped_sem += n_sem
+                
+        return kept, dropped_eng, dropped_sem
+    
+    def _filter_parallel(self, chunks, workers):
+        """Filters chunks in a process pool, yielding results in input order (at most two chunks per worker in flight)."""
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_clean_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def _filter_lines(self, lines):
+        """Filters a chunk of raw lines: returns the kept lines (original bytes) and the drop counts."""
+        kept_lines = []
+        dropped_eng = 0
+        dropped_sem = 0
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for k in kept:
-                f.write(json.dumps(k, ensure_ascii=False) + "\n")
+        for line in lines:
+            if not line.strip(): continue
+            try:
+                obj = orjson.loads(line)
+                # lowercased once, shared by both filters
+                sentence_lc = obj['sentence'].lower()
+                
+                # avoid English sentences
+                if self.eng_filter.is_english(sentence_lc, lowercased=True):
+                    dropped_eng += 1
+                    continue
+                
+                # potential false contexts + homonym clashes
+                if self.sem_filter.is_false_positive(obj, sentence_lc):
+                    dropped_sem += 1
+                    continue
+                
+                # original bytes, no need to re-serialize
+                kept_lines.append(line if line.endswith(b"\n") else line + b"\n")
                 
-        return len(kept), dropped_eng, dropped_sem
\ No newline at end of file
+            except orjson.JSONDecodeError:
+                continue
+            
+        return kept_lines, dropped_eng, dropped_sem
\ No newline at end of file
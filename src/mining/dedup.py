@@ -0,0 +1,89 @@
+# dedup.py
+# ----------------------------------------------------------------
+# removes near-duplicate mined sentences (MinHash LSH), per seed
+# ----------------------------------------------------------------
+# adriana r.f. (@adrmisty)
+# oct-2026
+
+import os
+import re
+import orjson
+from datasketch import MinHash, MinHashLSH
+
+class NearDuplicateFilter:
+    """Flags sentences that are near-duplicates of an already seen sentence of the same seed (lang, term, type):
+    the same sentence found for another seed is a separate annotation, not a repeat (as when mining).
+    Similarity is the (MinHash-estimated) Jaccard index over word 5-gram shingles."""
+
+    def __init__(self, threshold=0.8, num_perm=128, shingle_size=5):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # LSH bands/rows for the threshold, optimized once (datasketch integrates them anew for each index otherwise)
+        lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        self.params = (lsh.b, lsh.r)
+        self.indexes = {} # per-seed LSH index
+        self.n_seen = 0
+
+    def is_duplicate(self, entry: dict) -> bool:
+        """Returns True if a near-duplicate was seen before, otherwise indexes the sentence."""
+        seed = (entry.get('lang', ''), entry.get('term', ''), entry.get('type', ''))
+        if seed not in self.indexes:
+            self.indexes[seed] = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm, params=self.params)
+        lsh = self.indexes[seed]
+
+        minhash = self._minhash(entry.get('sentence', ''))
+        if lsh.query(minhash):
+            return True
+
+        # only first-seen sentences are indexed, so each cluster keeps its first element
+        lsh.insert(self.n_seen, minhash)
+        self.n_seen += 1
+        return False
+
+    def _minhash(self, sentence: str) -> MinHash:
+        words = re.findall(r'\w+', sentence.lower())
+        n = self.shingle_size
+        # short sentences are a single shingle
+        shingles = {" ".join(words[i:i+n]) for i in range(max(len(words) - n + 1, 1))}
+
+        minhash = MinHash(num_perm=self.num_perm)
+        minhash.update_batch(s.encode('utf-8') for s in shingles)
+        return minhash
+
+class MiningDeduplicator:
+    """Drops near-duplicate mined sentences in a file, keeping the first occurrence."""
+
+    def __init__(self, threshold=0.8):
+        self.dup_filter = NearDuplicateFilter(threshold=threshold)
+
+    def dedup_file(self, input_path, output_path):
+        kept = 0
+        dropped = 0
+
+        # kept lines are written aside as they are read, and moved into place once complete:
+        # a crash mid-write never truncates a previous output
+        tmp_path = output_path + ".part"
+        try:
+            with open(input_path, 'rb') as f_in, open(tmp_path, 'wb') as f_out:
+                for line in f_in:
+                    if not line.strip(): continue
+                    try:
+                        obj = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+
+                    if self.dup_filter.is_duplicate(obj):
+                        dropped += 1
+                        continue
+
+                    f_out.write(line.rstrip(b'\r\n') + b"\n")
+                    kept += 1
+        except BaseException:
+            # no partial output left behind
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, output_path)
+
+        return kept, dropped
@@ -5,102 +5,248 @@
 # adriana r.f. (@adrmisty)
 # jan-2026
 
-import wikipediaapi
 import time
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import re
+from functools import lru_cache
+from collections import OrderedDict
+from bisect import bisect_right
+
+MAX_RETRIES = 4 # for rate-limited (429) or failing (5xx) API calls
+POOL_SIZE = 16 # keep-alive connections per host, at least the mining concurrency
+API_RATE = 15 # requests/s to the API, across all threads (about what the old serial crawl made; the public API is shared)
+API_BURST = 5 # requests allowed at once after idling
+PENDING_FACTOR = 4 # terms submitted ahead of the seeds consumed, per mining thread
+PAGE_CACHE_SIZE = 512 # pages kept in memory (text and split); the forms of a root are mined together, so shared pages are recent
+
+API_URL = "https://{lang}.wikipedia.org/w/api.php"
+# fixed parts of the API queries (the per-call parts are added to a copy)
+SEARCH_PARAMS = {"action": "query", "list": "search", "format": "json"}
+EXTRACT_PARAMS = {"action": "query", "prop": "extracts", "explaintext": 1, "exsectionformat": "wiki", "redirects": 1, "format": "json"}
+
+# section heading of a plain-text page extract ('\n\n== History ==\n')
+SECTION_HEADING_RE = re.compile(r'\n\n *(==+) (.*?) (==+) *\n')
+
+# sentence boundary: end punctuation followed by spaces/line breaks
+SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])[ \n]+')
 
 FALSE_POSITIVES = {
-    "scan": ["Scania", "Skåne", "VABIS", "Saab", "Volkswagen"], 
-    "ban":  ["Ki-moon", "Ki-mun", "Ban Ki", "Naciones Xuníes"],
-    "bug":  ["Bugs Bunny", "Bunny", "Looney", "Warner", "Disney", "Rabbit"], 
-    "post": ["Washington Post", "The Post", "New York Post", "post reges", "Post-Newsweek", "Post-punk", "post-punk"], 
-    "bot":  ["Bot.", "Zool.", "Acta Bot", "Nat.,Bot", "Ser. Bot"], 
-    "scroll": ["Elder Scrolls", "Mojang", "Scrolls", "Morrowind", "Oblivion"], 
-    "like": ["Like a Rolling Stone", "Like a Prayer", "Like a Virgin", "Nothing's Shocking", "Smells Like Teen Spirit"], 
-    "hack": ["Hack-a-Shaq", "Hack and slash", "hack and slash"] 
+    "scan": ("Scania", "Skåne", "VABIS", "Saab", "Volkswagen"), 
+    "ban":  ("Ki-moon", "Ki-mun", "Ban Ki", "Naciones Xuníes"),
+    "bug":  ("Bugs Bunny", "Bunny", "Looney", "Warner", "Disney", "Rabbit"), 
+    "post": ("Washington Post", "The Post", "New York Post", "post reges", "Post-Newsweek", "Post-punk", "post-punk"), 
+    "bot":  ("Bot.", "Zool.", "Acta Bot", "Nat.,Bot", "Ser. Bot"), 
+    "scroll": ("Elder Scrolls", "Mojang", "Scrolls", "Morrowind", "Oblivion"), 
+    "like": ("Like a Rolling Stone", "Like a Prayer", "Like a Virgin", "Nothing's Shocking", "Smells Like Teen Spirit"), 
+    "hack": ("Hack-a-Shaq", "Hack and slash", "hack and slash") 
 }
+# one (case-sensitive) alternation per lemma: a single scan of the sentence for any of its triggers
+FALSE_POSITIVE_PATTERNS = {lemma: re.compile("|".join(map(re.escape, triggers))) for lemma, triggers in FALSE_POSITIVES.items()}
+
+@lru_cache(maxsize=4096)
+def term_pattern(term: str) -> re.Pattern:
+    """Whole-word pattern for a term, to be searched in lowercased text (cheaper than re.IGNORECASE).
+    Escaped and compiled once for all the pages it is searched in."""
+    return re.compile(r'\b' + re.escape(term.lower()) + r'\b')
+
+@lru_cache(maxsize=4096)
+def term_pattern_ci(term: str) -> re.Pattern:
+    """Whole-word, case-insensitive pattern for a term, for the few sentences that lowercasing would lengthen
+    ('İ' -> 'i̇' adds a combining dot, which moves the word boundaries)."""
+    return re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE)
+
+def extract_to_text(extract: str) -> str:
+    """Page text from a plain-text extract: headings become bare title lines, as in wikipediaapi's `page.text`
+    (so that sentences split the same way as with the pages mined through it)."""
+    headings = list(SECTION_HEADING_RE.finditer(extract))
+    if not headings:
+        return extract.strip()
+    
+    summary = extract[:headings[0].start()].strip()
+    parts = [summary + "\n\n"] if summary else []
+    for heading, following in zip(headings, headings[1:] + [None]):
+        body = extract[heading.end():following.start()].strip() if following else extract[heading.end():]
+        parts.append(heading.group(2).strip() + "\n" + body + ("\n\n" if body else ""))
+    return "".join(parts).strip()
+
+class TokenBucket:
+    """Thread-safe rate limiter: `rate` tokens per second, at most `burst` stored."""
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available, and takes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            # sleep outside the lock, so other threads can refill/take meanwhile
+            time.sleep(wait)
 
 class WikipediaMiner:
     def __init__(self, user_agent: str):
         self.user_agent = user_agent
-        self.wikis = {} # per-language
-
-    def get_wiki_object(self, lang: str):
-        """Lazy loader for WikipediaAPI objects."""
-        if lang not in self.wikis:
-            self.wikis[lang] = wikipediaapi.Wikipedia(
-                user_agent=self.user_agent,
-                language=lang,
-                extract_format=wikipediaapi.ExtractFormat.WIKI
-            )
-        return self.wikis[lang]
-
-    def search_and_extract(self, seeds_df: pd.DataFrame, limit_per_seed: int = 2) -> List[Dict]:
+        # keep-alive connections, reused by all search calls (and threads)
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": user_agent})
+        # pooling only: retries stay in _get_json, so each attempt goes through the token bucket
+        self.session.mount("https://", HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE))
+        self.bucket = TokenBucket(rate=API_RATE, burst=API_BURST) # shared API throttle (instead of a per-call sleep)
+        self.pages = OrderedDict() # per-(lang, title), shared by all seeds that surface the page (least recently used evicted)
+        self._pages_lock = threading.Lock()
+
+    def search_and_extract(self, seeds_df: pd.DataFrame, limit_per_seed: int = 2, concurrency: int = 8) -> List[Dict]:
         """Iterates seeds, finds pages, extracts sentences, and filters false positives."""
-        results = []
-        total_seeds = len(seeds_df)
-                
-        # for every seed...
-        for idx, row in seeds_df.iterrows():
-            term = row['term']
-            lang = row['lang']
-            lemma = row['lemma']
-            
-            # SEARCH: relevant Wikipedia Titles using Requests
-            found_titles = self._search_wiki_titles(term, lang, limit=limit_per_seed)
-            
-            if not found_titles:
-                continue
+        return [entry for entries in self.iter_seed_results(seeds_df, limit_per_seed, concurrency) for entry in entries]
 
-            # EXTRACT: get page content and find sentences
-            wiki = self.get_wiki_object(lang)
+    def iter_seed_results(self, seeds_df: pd.DataFrame, limit_per_seed: int = 2, concurrency: int = 8):
+        """
+        Yields the entries of each seed in seed order, as soon as they are mined (so they can be written as they come).
+        Each (term, lang) is mined once, however many seeds share it (different types/lemmas),
+        concurrently (network-bound), at most `concurrency` at a time.
+        """
+        found = 0
+        total_seeds = len(seeds_df)
+        rows = list(seeds_df.itertuples(index=False)) # namedtuples: no per-row Series boxing
+        
+        # (term, lang) keys in order of first use, and the last seed using each (its matches are dropped after it)
+        first_use = {}
+        last_use = {}
+        for idx, row in enumerate(rows):
+            first_use.setdefault((row.term, row.lang), idx)
+            last_use[(row.term, row.lang)] = idx
+        keys = list(first_use)
+        max_pending = concurrency * PENDING_FACTOR
+        
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = {}
+            next_key = 0
             
-            for title in found_titles:
+            # collected in seed order, so the output matches a serial run
+            for idx, row in enumerate(rows):
+                # submitted a few terms ahead of the seeds consumed (backpressure), but always up to the current seed's
+                while next_key < len(keys) and (len(futures) < max_pending or first_use[keys[next_key]] <= idx):
+                    term, lang = keys[next_key]
+                    futures[keys[next_key]] = pool.submit(self._mine_term, term, lang, limit_per_seed)
+                    next_key += 1
+                
+                key = (row.term, row.lang)
+                future = futures[key] if last_use[key] > idx else futures.pop(key)
+                entries = []
                 try:
-                    page = wiki.page(title)
-                    if page.exists():
-                        matches = self._get_sentences(page.text, term)
-                        
-                        for sentence in matches:
-                            # FILTER: check for identified false positives (Scania, Bugs Bunny...)
-                            if not self._is_semantic_false_positive(lemma, term, sentence):
-                                results.append({
-                                    "term": term,
-                                    "lemma": lemma,
-                                    "lang": lang,
-                                    "type": row['type'],
-                                    "pos": row['pos'],
-                                    "sentence": sentence,
-                                    "source_page": title
-                                })
+                    entries = self._seed_results(row, future.result())
                 except Exception as e:
-                    continue
-            
-            if idx % 1 == 0:
-                print(f"\rProcessed {idx+1}/{total_seeds} | Found: {len(results)} | Current: {term} ({lang})   ", end="", flush=True)    
-                    
+                    # a single failing seed must not abort the whole run
+                    print(f"\n(!) > Seed '{row.term}' ({row.lang}) failed: {e}")
+                
+                found += len(entries)
+                print(f"\rProcessed {idx+1}/{total_seeds} | Found: {found} | Current: {row.term} ({row.lang})   ", end="", flush=True)    
+                yield entries
+        finally:
+            # if the consumer stops early (Ctrl-C, write error, closed generator), queued seeds are dropped
+            # instead of being mined: only the ones already running finish
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _mine_term(self, term: str, lang: str, limit: int) -> List[Tuple[str, str]]:
+        """Finds pages for a term and extracts its sentences, as (title, sentence) pairs."""
+        matches = []
+        
+        # SEARCH: relevant Wikipedia Titles using Requests
+        found_titles = self._search_wiki_titles(term, lang, limit=limit)
+        
+        # EXTRACT: get page content and find sentences
+        for title in found_titles:
+            try:
+                text, split = self._get_page(lang, title)
+                for sentence in self._get_sentences(text, term, split):
+                    matches.append((title, sentence))
+            except Exception as e:
+                continue
+        
+        return matches
+
+    def _seed_results(self, row, matches: List[Tuple[str, str]]) -> List[Dict]:
+        """Entries of a seed for its term's matches, without its lemma's false positives."""
+        results = []
+        for title, sentence in matches:
+            # FILTER: check for identified false positives (Scania, Bugs Bunny...)
+            if not self._is_semantic_false_positive(row.lemma, row.term, sentence):
+                results.append({
+                    "term": row.term,
+                    "lemma": row.lemma,
+                    "lang": row.lang,
+                    "type": row.type,
+                    "pos": row.pos,
+                    "sentence": sentence,
+                    "source_page": title
+                })
+        
         return results
 
+    def _get_page(self, lang: str, title: str):
+        """
+        Downloads a page's text (empty if the page does not exist) and splits it into sentences (see `_split_text`).
+        Inflected variants of a seed (click, clicks, facer click...) mostly surface the same pages,
+        so concurrent requests for a page being fetched wait for that download instead of repeating it,
+        and the last PAGE_CACHE_SIZE pages are kept for the terms that come after.
+        """
+        key = (lang, title)
+        with self._pages_lock:
+            pending = self.pages.get(key)
+            is_owner = pending is None
+            if is_owner:
+                pending = self.pages[key] = Future()
+                if len(self.pages) > PAGE_CACHE_SIZE:
+                    self.pages.popitem(last=False) # threads still waiting on it keep their own reference
+            else:
+                self.pages.move_to_end(key)
+        
+        if is_owner:
+            try:
+                text = self._fetch_page_text(lang, title)
+                pending.set_result((text, self._split_text(text)))
+            except Exception as e:
+                # failed fetches are not cached, so the next term surfacing the page retries it
+                with self._pages_lock:
+                    if self.pages.get(key) is pending:
+                        del self.pages[key]
+                pending.set_exception(e)
+                
+        return pending.result()
+
+    def _fetch_page_text(self, lang: str, title: str) -> str:
+        """Downloads a page's plain text in a single API call (empty if the page does not exist)."""
+        data = self._get_json(API_URL.format(lang=lang), {**EXTRACT_PARAMS, "titles": title})
+        
+        for page in data.get("query", {}).get("pages", {}).values():
+            if "missing" in page or "invalid" in page:
+                return ""
+            return extract_to_text(page.get("extract", ""))
+        return ""
+
     def _search_wiki_titles(self, term: str, lang: str, limit: int = 3) -> List[str]:
         """
         Uses standard requests to query the Wikipedia Search API.
         This finds pages *mentioning* the term, not just exact titles.
         """
-        url = f"https://{lang}.wikipedia.org/w/api.php"
-        params = {
-            "action": "query",
-            "list": "search",
-            "srsearch": f'"{term}"', # Exact phrase search
-            "format": "json",
-            "srlimit": limit
-        }
+        params = {**SEARCH_PARAMS, "srsearch": f'"{term}"', "srlimit": limit} # exact phrase search
         try:
-            time.sleep(0.05)
-            r = requests.get(url, params=params, headers={"User-Agent": self.user_agent}, timeout=5)
-            data = r.json()
+            data = self._get_json(API_URL.format(lang=lang), params)
             
             titles = []
             if "query" in data and "search" in data["query"]:
@@ -110,33 +256,84 @@ class WikipediaMiner:
         except Exception:
             return []
 
-    def _get_sentences(self, text: str, term: str) -> List[str]:
-        """Splits text into sentences and returns those containing the term."""
+    def _get_json(self, url: str, params: Dict) -> Dict:
+        """Throttled GET with retries: honors 'Retry-After' on 429/5xx, otherwise backs off exponentially."""
+        for attempt in range(MAX_RETRIES + 1):
+            self.bucket.acquire() # retries are throttled too
+            r = self.session.get(url, params=params, timeout=5)
+            
+            if r.status_code != 429 and r.status_code < 500:
+                return r.json()
+            if attempt == MAX_RETRIES:
+                r.raise_for_status()
+            
+            retry_after = r.headers.get("Retry-After", "")
+            time.sleep(float(retry_after) if retry_after.isdigit() else 2 ** attempt)
+
+    def _split_text(self, text: str):
+        """Lowercased text, sentence spans and sentence start offsets (sorted, for bisection) of a text.
+        The lowercased text is None if lowering changed its length ('İ' -> 'i̇'), as spans would not line up."""
+        text_lc = text.lower()
+        spans = list(self._iter_sentence_spans(text))
+        return (text_lc if len(text_lc) == len(text) else None), spans, [start for start, _ in spans]
+
+    def _get_sentences(self, text: str, term: str, split=None) -> List[str]:
+        """Splits text into sentences (unless already `split`) and returns those containing the term."""
         
         sentences = []
-        raw_sentences = re.split(r'(?<=[.!?]) +', text.replace('\n', ' '))
+        pattern = term_pattern(term)
+        text_lc, spans, starts = split if split is not None else self._split_text(text)
         
-        pattern = r'\b' + re.escape(term) + r'\b'
+        if text_lc is not None:
+            matched = self._matching_spans(text_lc, spans, starts, pattern, term.lower())
+        else:
+            matched = [(start, end) for start, end in spans if self._sentence_matches(text[start:end], term, pattern)]
         
-        for sent in raw_sentences:
-            if re.search(pattern, sent, re.IGNORECASE):
-                # cleanup
-                clean_sent = sent.strip()
-                if 10 < len(clean_sent) < 500:
-                    sentences.append(clean_sent)
+        # only matching sentences are ever sliced out
+        for start, end in matched:
+            # cleanup (line breaks within a sentence become spaces)
+            clean_sent = text[start:end].strip().replace('\n', ' ')
+            if 10 < len(clean_sent) < 500:
+                sentences.append(clean_sent)
         
         return sentences
 
+    def _sentence_matches(self, sentence: str, term: str, pattern: re.Pattern) -> bool:
+        """Whether a sentence contains the term, searched lowercased unless lowering changes its length."""
+        sentence_lc = sentence.lower()
+        if len(sentence_lc) == len(sentence):
+            return pattern.search(sentence_lc) is not None
+        return term_pattern_ci(term).search(sentence) is not None
+
+    def _matching_spans(self, text_lc: str, spans, starts: List[int], pattern: re.Pattern, literal: str):
+        """Spans of the sentences containing a match, in a single pass over the whole page:
+        occurrences of the term are found by plain substring search (far faster than scanning with a leading \\b),
+        located in their sentence by bisection, and then checked against the pattern within that sentence."""
+        matched = []
+        pos = text_lc.find(literal)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            start, end = spans[i]
+            if pattern.match(text_lc, pos, end):
+                matched.append((start, end))
+                pos = text_lc.find(literal, end) # rest of the sentence already taken
+            else:
+                pos = text_lc.find(literal, pos + 1)
+        return matched
+
+    def _iter_sentence_spans(self, text: str):
+        """Yields the (start, end) spans of the sentences of a text lazily (no copy of the whole text)."""
+        start = 0
+        for boundary in SENTENCE_BOUNDARY_RE.finditer(text):
+            yield start, boundary.start()
+            start = boundary.end()
+        yield start, len(text)
+
     def _is_semantic_false_positive(self, lemma: str, term: str, sentence: str) -> bool:
         """Checks for pre-identified false positives."""
         
-        if lemma == "bot" and term == "bot" and "Bot." in sentence:
+        pattern = FALSE_POSITIVE_PATTERNS.get(lemma)
+        if pattern is not None and pattern.search(sentence):
             return True
-
-        if lemma in FALSE_POSITIVES:
-            triggers = FALSE_POSITIVES[lemma]
-            for trigger in triggers:
-                if trigger in sentence:
-                    return True
         
         return False
\ No newline at end of file